@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, List
 
 import requests
 
+from .http_utils import RETRYABLE_EXCEPTIONS, backoff_delay, build_session, is_retryable_status, retry_after_seconds
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,17 +16,46 @@ class AlphaVantageMCPClient:
     Lightweight JSON-RPC client for the Alpha Vantage MCP HTTP endpoint.
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://mcp.alphavantage.co/mcp") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://mcp.alphavantage.co/mcp",
+        max_retries: int = 4,
+        backoff_seconds: float = 0.5,
+        max_connections: int = 64,
+    ) -> None:
         if "apikey=" in base_url:
             self.base_url = base_url
         else:
             self.base_url = f"{base_url}?apikey={api_key}"
-        self.session = requests.Session()
+        self.session = build_session(max_connections)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        """POST with jittered exponential backoff on connection errors, timeouts, 429 and 5xx."""
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.post(self.base_url, json=payload, timeout=60)
+            except RETRYABLE_EXCEPTIONS as exc:
+                if attempt >= self.max_retries:
+                    raise
+                wait = backoff_delay(attempt, self.backoff_seconds)
+                logger.warning("%s calling MCP %s; retrying in %.1fs", type(exc).__name__, payload["method"], wait)
+            else:
+                if not is_retryable_status(resp.status_code) or attempt >= self.max_retries:
+                    resp.raise_for_status()
+                    return resp
+                wait = retry_after_seconds(resp)
+                wait = wait if wait is not None else backoff_delay(attempt, self.backoff_seconds)
+                logger.warning("HTTP %d calling MCP %s; retrying in %.1fs", resp.status_code, payload["method"], wait)
+            time.sleep(wait)
+            attempt += 1
 
     def _rpc(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-        resp = self.session.post(self.base_url, json=payload, timeout=60)
-        resp.raise_for_status()
+        resp = self._post(payload)
         data = resp.json()
         if "error" in data:
             raise RuntimeError(f"MCP error {data['error']}")
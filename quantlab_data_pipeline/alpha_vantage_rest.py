@@ -1,32 +1,165 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import deque
 from io import StringIO
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import requests
 
+from .http_utils import RETRYABLE_EXCEPTIONS, backoff_delay, build_session, is_retryable_status, retry_after_seconds
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.alphavantage.co/query"
 
 
+class RateLimiter:
+    """Thread-safe sliding-window limiter: at most `calls` acquisitions per `period` seconds."""
+
+    def __init__(self, calls: int, period: float = 60.0):
+        self.calls = calls
+        self.period = period
+        self._stamps: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self.period:
+                    self._stamps.popleft()
+                if len(self._stamps) < self.calls:
+                    self._stamps.append(now)
+                    return
+                wait = self.period - (now - self._stamps[0])
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on in-flight requests: grows by roughly one slot per window of successful
+    calls and halves when the server signals throttling (429/5xx).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> "AdaptiveConcurrency":
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit / 2)
+
+
 class AlphaVantageRESTClient:
     """Minimal REST client for Alpha Vantage CSV endpoints."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        calls_per_minute: Optional[int] = None,
+        min_interval: Optional[float] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 4,
+        backoff_seconds: float = 0.5,
+        max_connections: int = 64,
+    ):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = build_session(max_connections)
+        # Shared across threads so concurrent callers stay within the API quota. `min_interval`
+        # spaces calls evenly (one per `min_interval` seconds, no bursts); `calls_per_minute`
+        # allows up to that many calls in any 60s window.
+        if min_interval and min_interval > 0:
+            self.rate_limiter: Optional[RateLimiter] = RateLimiter(1, period=min_interval)
+        elif calls_per_minute:
+            self.rate_limiter = RateLimiter(calls_per_minute)
+        else:
+            self.rate_limiter = None
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._paused_until = 0.0
+        self._pause_lock = threading.Lock()
+
+    def _throttle(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _pause(self, seconds: float) -> None:
+        with self._pause_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _get(self, params: dict) -> requests.Response:
+        """
+        GET with header-aware pausing and AIMD concurrency. Connection errors, timeouts,
+        429 and 5xx are retried with jittered exponential backoff (or the server's Retry-After).
+        """
+        function = params.get("function")
+        attempt = 0
+        while True:
+            self._throttle()
+            try:
+                with self.concurrency:
+                    resp = self.session.get(BASE_URL, params=params, timeout=60)
+            except RETRYABLE_EXCEPTIONS as exc:
+                if attempt >= self.max_retries:
+                    raise
+                wait = backoff_delay(attempt, self.backoff_seconds)
+                logger.warning("%s for %s; retrying in %.1fs", type(exc).__name__, function, wait)
+                time.sleep(wait)
+                attempt += 1
+                continue
+            wait = retry_after_seconds(resp)
+            if is_retryable_status(resp.status_code):
+                self.concurrency.on_throttle()
+                if attempt < self.max_retries:
+                    wait = wait if wait is not None else backoff_delay(attempt, self.backoff_seconds)
+                    logger.warning("HTTP %d for %s; retrying in %.1fs", resp.status_code, function, wait)
+                    self._pause(wait)
+                    attempt += 1
+                    continue
+            else:
+                self.concurrency.on_success()
+                if wait:
+                    # Quota exhausted but this call succeeded: hold further calls until the window resets.
+                    self._pause(wait)
+            resp.raise_for_status()
+            return resp
 
     def fetch_json(self, function: str, params: Optional[dict] = None) -> dict:
         payload = {"function": function, "apikey": self.api_key}
         if params:
             payload.update(params)
         logger.info("Fetching %s via REST (json)", function)
-        resp = self.session.get(BASE_URL, params=payload, timeout=60)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get(payload).json()
 
     def fetch_time_series_csv(
         self,
@@ -46,11 +179,18 @@ class AlphaVantageRESTClient:
             params["adjusted"] = "false"
 
         logger.info("Fetching %s via REST for %s", function, symbol)
-        resp = self.session.get(BASE_URL, params=params, timeout=60)
-        resp.raise_for_status()
-        text = resp.text
-        df = pd.read_csv(StringIO(text))
-        # Normalize column names to lower snake for consistency
-        df.columns = [c.strip().lower() for c in df.columns]
+        resp = self._get(params)
+        try:
+            # Parse the raw bytes with Arrow's multithreaded reader; no str decode/re-encode round trip.
+            table = pacsv.read_csv(pa.BufferReader(resp.content))
+        except pa.ArrowInvalid:
+            table = None
+        if table is not None:
+            # Normalize column names to lower snake for consistency
+            df = table.rename_columns([c.strip().lower() for c in table.column_names]).to_pandas()
+        else:
+            # Error/rate-limit notes arrive as JSON text; pandas' lenient parse keeps them for failure scans.
+            df = pd.read_csv(StringIO(resp.text))
+            df.columns = [c.strip().lower() for c in df.columns]
         df["symbol"] = symbol
         return df
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import copy
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+from .paths import repo_root
+
 logger = logging.getLogger(__name__)
 
+# Parsed files keyed by (path, parser), invalidated when the file's (mtime, size) changes.
+_FILE_CACHE_MAX = 16
+_FILE_CACHE: "OrderedDict[Tuple[Path, str], Tuple[int, int, Any]]" = OrderedDict()
+
 
 def _candidate_paths() -> list[Path]:
-    base = Path(__file__).resolve().parents[1]
+    base = repo_root()
     return [
         base / "credentials.yml",
         base / "config" / "credentials.yml",
@@ -18,6 +31,49 @@ def _candidate_paths() -> list[Path]:
     ]
 
 
+def _parse_credentials(raw: str) -> Dict[str, Any]:
+    data = yaml.load(raw, Loader=_YamlLoader) or {}
+    if isinstance(data, str):
+        # Fallback for key=value style files.
+        parsed: Dict[str, Any] = {}
+        for line in raw.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, val = line.split("=", 1)
+            key = key.strip()
+            val = val.strip().strip('"').strip("'")
+            parsed[key] = val
+        data = parsed
+    return data
+
+
+def _load_cached(path: Path, kind: str, parse: Callable[[str], Any]) -> Any:
+    """Parse `path` with `parse`, reusing the previous result while the file is unchanged."""
+    st = path.stat()
+    key = (path, kind)
+    cached = _FILE_CACHE.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _FILE_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with path.open("r", encoding="utf-8") as f:
+        raw = f.read()
+    data = parse(raw)
+    logger.info("Loaded %s from %s", kind, path)
+    _FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _FILE_CACHE.move_to_end(key)
+    while len(_FILE_CACHE) > _FILE_CACHE_MAX:
+        _FILE_CACHE.popitem(last=False)
+    # Callers may mutate the result; keep the cached copy pristine.
+    return copy.deepcopy(data)
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML config file; repeated loads of an unchanged file skip the parse."""
+    return _load_cached(path, "yaml", lambda raw: yaml.load(raw, Loader=_YamlLoader))
+
+
 def load_credentials(path: Optional[Path] = None) -> Dict[str, Any]:
     """
     Load credentials from YAML.
@@ -32,23 +88,10 @@ def load_credentials(path: Optional[Path] = None) -> Dict[str, Any]:
         paths = _candidate_paths()
 
     for candidate in paths:
-        if candidate.exists():
-            with candidate.open("r", encoding="utf-8") as f:
-                raw = f.read()
-            data = yaml.safe_load(raw) or {}
-            if isinstance(data, str):
-                # Fallback for key=value style files.
-                parsed: Dict[str, Any] = {}
-                for line in raw.splitlines():
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, val = line.split("=", 1)
-                    key = key.strip()
-                    val = val.strip().strip('"').strip("'")
-                    parsed[key] = val
-                data = parsed
-            logger.info("Loaded credentials from %s", candidate)
-            return data
+        try:
+            data = _load_cached(candidate, "credentials", _parse_credentials)
+        except FileNotFoundError:
+            continue
+        return data
 
     raise FileNotFoundError("No credentials YAML found in expected locations.")
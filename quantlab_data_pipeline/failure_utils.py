@@ -1,32 +1,106 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from .alpha_vantage_rest import AlphaVantageRESTClient
 from .config_loader import load_credentials
-from .ingestion import REST_FUNCTION_MAP, _json_to_df, _write_split_by_period
+from .ingestion import (
+    _PERIODIZED_ENDPOINTS,
+    REST_FUNCTION_MAP,
+    _json_to_df,
+    _write_parquet,
+    _write_split_by_period,
+)
 from .paths import final_dataset_path, final_dir, raw_data_dir
+from .transform import _FINAL_WRITE_KW, _ROW_GROUP_ROWS
 
 logger = logging.getLogger(__name__)
 
+_API_URL_PREFIX = "https://www.alphavantage.co/query?function="
+_INVALID_CALL_TOKENS = ("invalid api call",)
+_FAILURE_TOKENS = ("invalid api call", "thank you for using alpha vantage")
+_SCAN_BATCH_ROWS = 64_000
+# Keep strings Arrow-backed when materializing rows; string ops then run on contiguous UTF-8 buffers.
+_TO_PANDAS_KW = {"types_mapper": pd.ArrowDtype}
+
+
+def _is_string_type(typ: pa.DataType) -> bool:
+    if pa.types.is_dictionary(typ):
+        typ = typ.value_type
+    return pa.types.is_string(typ) or pa.types.is_large_string(typ)
+
+
+def _string_columns(table: pa.Table) -> Iterator[pa.ChunkedArray]:
+    for col in table.columns:
+        if not _is_string_type(col.type):
+            continue
+        if pa.types.is_dictionary(col.type):
+            col = col.cast(col.type.value_type)
+        yield col
+
+
+def _token_mask(table: pa.Table, tokens: tuple[str, ...] = _INVALID_CALL_TOKENS) -> pa.ChunkedArray:
+    """
+    Row mask for cells containing any of `tokens` (case-insensitive), computed on the Arrow buffers.
+    Only string columns are scanned; numeric and date columns cannot hold the tokens.
+    """
+    mask = pa.chunked_array([pc.fill_null(pa.nulls(table.num_rows, pa.bool_()), False)])
+    for col in _string_columns(table):
+        for token in tokens:
+            mask = pc.or_(mask, pc.fill_null(pc.match_substring(col, token, ignore_case=True), False))
+    return mask
+
+
+def _first_match(table: pa.Table, tokens: tuple[str, ...]) -> Optional[str]:
+    """First cell (column by column) containing any of `tokens`, or None."""
+    for col in _string_columns(table):
+        for token in tokens:
+            hits = pc.fill_null(pc.match_substring(col, token, ignore_case=True), False)
+            idx = pc.index(hits, True).as_py()
+            if idx >= 0:
+                return col[idx].as_py()
+    return None
+
+
+def _open_parquet(path: Path) -> pa.Table:
+    """Read a parquet file through a memory map so the OS page cache backs the Arrow buffers."""
+    return pq.read_table(path, memory_map=True)
+
+
+def _write_csv(df: pd.DataFrame, target: Path) -> None:
+    """Write a CSV through Arrow's writer instead of pandas' per-cell Python formatting."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(target))
+
+
+def _api_urls(function: pd.Series, ticker: pd.Series) -> pd.Series:
+    """Build suggested REST URLs column-wise rather than row by row."""
+    return _API_URL_PREFIX + function.astype(str) + "&symbol=" + ticker.astype(str) + "&apikey=YOUR_KEY"
+
 
 def export_fundamental_failures(temp_csv: Optional[Path] = None) -> Path:
     """
     Scan the fundamentals dataset for rows containing 'invalid api call'
     and write a CSV with the affected ticker/statement and suggested REST URLs.
     """
-    df = pd.read_parquet(final_dataset_path("fundamentals"))
-    mask = df.astype(str).apply(lambda col: col.str.contains("invalid api call", case=False, na=False)).any(axis=1)
-    failures = df.loc[mask].copy()
-    if failures.empty:
+    table = _open_parquet(final_dataset_path("fundamentals"))
+    mask = _token_mask(table)
+    if not pc.any(mask).as_py():
         logger.info("No 'invalid api call' rows found in fundamentals dataset.")
         return temp_csv or final_dir() / "failures_temp.csv"
 
-    # Derive basic metadata
+    # Derive basic metadata; only the identifying columns of matching rows are materialized.
+    keep = [c for c in ("ticker", "statement", "symbol", "function") if c in table.column_names]
+    failures = table.filter(mask).select(keep).to_pandas(**_TO_PANDAS_KW)
     cols = [c for c in failures.columns if c in {"ticker", "statement", "symbol"}]
     out = failures[cols].copy() if cols else pd.DataFrame(index=failures.index)
     if "ticker" not in out.columns and "symbol" in failures.columns:
@@ -36,14 +110,12 @@ def export_fundamental_failures(temp_csv: Optional[Path] = None) -> Path:
 
     # Suggested API call
     out["function"] = out.get("statement", None) if "statement" in out else out.get("function", None)
-    out["api_url"] = out.apply(
-        lambda r: f"https://www.alphavantage.co/query?function={r.get('function')}&symbol={r.get('ticker')}&apikey=YOUR_KEY",
-        axis=1,
-    )
+    tickers = out["ticker"] if "ticker" in out.columns else pd.Series(None, index=out.index, dtype=object)
+    out["api_url"] = _api_urls(out["function"], tickers)
 
     target = temp_csv or final_dir() / "failures_temp.csv"
     target.parent.mkdir(parents=True, exist_ok=True)
-    out.to_csv(target, index=False)
+    _write_csv(out, target)
     logger.info("Exported %d fundamental failures to %s", len(out), target)
     return target
 
@@ -53,14 +125,15 @@ def export_company_overview_failures(temp_csv: Optional[Path] = None) -> Path:
     Scan the company_overview dataset for rows containing 'invalid api call'
     and write a CSV with ticker and suggested REST URLs to re-fetch.
     """
-    df = pd.read_parquet(final_dataset_path("company_overview"))
-    mask = df.astype(str).apply(lambda col: col.str.contains("invalid api call", case=False, na=False)).any(axis=1)
-    failures = df.loc[mask].copy()
-    if failures.empty:
+    table = _open_parquet(final_dataset_path("company_overview"))
+    mask = _token_mask(table)
+    if not pc.any(mask).as_py():
         logger.info("No 'invalid api call' rows found in company_overview dataset.")
         return temp_csv or final_dir() / "company_overview_failures.csv"
 
-    out = pd.DataFrame()
+    keep = [c for c in ("ticker", "symbol") if c in table.column_names]
+    failures = table.filter(mask).select(keep).to_pandas(**_TO_PANDAS_KW)
+    out = pd.DataFrame(index=pd.RangeIndex(int(pc.sum(mask).as_py())))
     if "ticker" in failures.columns:
         out["ticker"] = failures["ticker"]
     elif "symbol" in failures.columns:
@@ -69,69 +142,90 @@ def export_company_overview_failures(temp_csv: Optional[Path] = None) -> Path:
         out["ticker"] = ""
 
     out["function"] = "OVERVIEW"
-    out["api_url"] = out.apply(
-        lambda r: f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={r.get('ticker')}&apikey=YOUR_KEY",
-        axis=1,
-    )
+    out["api_url"] = _api_urls(out["function"], out["ticker"])
 
     target = temp_csv or final_dir() / "company_overview_failures.csv"
     target.parent.mkdir(parents=True, exist_ok=True)
-    out.to_csv(target, index=False)
+    _write_csv(out, target)
     logger.info("Exported %d company overview failures to %s", len(out), target)
     return target
 
 
-def export_all_failures(temp_csv: Optional[Path] = None) -> Path:
+def _scan_one(path: Path) -> Optional[tuple[str, str, str, str]]:
+    """
+    Scan one raw parquet for API error payloads. Returns (ticker, endpoint, path, error_sample)
+    on a match, else None; runs in worker processes so only small tuples cross back.
+    """
+    try:
+        pf = pq.ParquetFile(path, memory_map=True)
+        str_cols = [f.name for f in pf.schema_arrow if _is_string_type(f.type)]
+        if pf.metadata.num_rows == 0 or not str_cols:
+            return None
+        # Stream only the string columns and stop at the first batch containing a token.
+        for batch in pf.iter_batches(batch_size=_SCAN_BATCH_ROWS, columns=str_cols):
+            sample = _first_match(pa.Table.from_batches([batch]), _FAILURE_TOKENS)
+            if sample is not None:
+                break
+        else:
+            return None
+    except Exception:
+        return None
+    parent = path.parent.name
+    endpoint = parent
+    if parent in {"annual", "quarterly"}:
+        endpoint = path.parent.parent.name
+    return path.stem, endpoint, str(path), sample
+
+
+def export_all_failures(temp_csv: Optional[Path] = None, max_workers: Optional[int] = None) -> Path:
     """
     Scan all raw parquet files for 'invalid api call' content and write a CSV with
     ticker, function (endpoint), and suggested REST URL.
+    Files are scanned in parallel on `max_workers` processes (default: CPU count).
     """
     logger.info("Scanning raw data for failures...")
-    rows = []
     base = raw_data_dir()
-    for path in base.rglob("*.parquet"):
-        if path.name.startswith("wrds_"):
-            continue
-        try:
-            df = pd.read_parquet(path)
-        except Exception:
-            continue
-        if df.empty:
-            continue
-        if not df.astype(str).apply(
-            lambda c: c.str.contains("invalid api call|thank you for using alpha vantage", case=False, na=False)
-        ).any().any():
-            continue
-        parent = path.parent.name
-        endpoint = parent
-        if parent in {"annual", "quarterly"}:
-            endpoint = path.parent.parent.name
-        ticker = path.stem
-        rows.append(
-            {
-                "ticker": ticker,
-                "function": endpoint,
-                "path": str(path),
-                "api_url": f"https://www.alphavantage.co/query?function={REST_FUNCTION_MAP.get(endpoint, endpoint)}&symbol={ticker}&apikey=YOUR_KEY",
-                "error_sample": df.astype(str).stack().iloc[0],
-            }
-        )
-    if not rows:
+    candidates = [p for p in base.rglob("*.parquet") if not p.name.startswith("wrds_")]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        hits = [hit for hit in executor.map(_scan_one, candidates, chunksize=16) if hit is not None]
+    if not hits:
         logger.info("No failures found in raw data.")
         return temp_csv or final_dir() / "failures_all.csv"
 
-    out_df = pd.DataFrame(rows)
+    out_df = pd.DataFrame(hits, columns=["ticker", "function", "path", "error_sample"])
+    functions = out_df["function"].map(REST_FUNCTION_MAP).fillna(out_df["function"])
+    out_df.insert(3, "api_url", _api_urls(functions, out_df["ticker"]))
     target = temp_csv or final_dir() / "failures_all.csv"
     target.parent.mkdir(parents=True, exist_ok=True)
-    out_df.to_csv(target, index=False)
+    _write_csv(out_df, target)
     logger.info("Exported %d failures to %s", len(out_df), target)
     return target
 
 
-def refetch_failures(failures_csv: Path, use_paid_key: bool = True, sleep_seconds: float = 1.0) -> None:
+def _write_refetched(df: pd.DataFrame, base_dir: Path, endpoint: str, ticker: str) -> None:
+    if endpoint in _PERIODIZED_ENDPOINTS:
+        _write_split_by_period(df, base_dir, endpoint, ticker)
+        # Drop stale single-file responses (often the original invalid payload).
+        single_path = base_dir / endpoint / f"{ticker}.parquet"
+        if single_path.exists():
+            single_path.unlink()
+            logger.info("Removed stale %s", single_path)
+    else:
+        _write_parquet(df, base_dir / endpoint / f"{ticker}.parquet")
+
+
+def refetch_failures(
+    failures_csv: Path,
+    use_paid_key: bool = True,
+    sleep_seconds: float = 1.0,
+    max_workers: int = 8,
+) -> None:
     """
     Re-fetch failed fundamentals/company overview calls listed in the given CSV
     and overwrite the raw parquet files. CSV expected columns: ticker, function.
+
+    Requests run concurrently on `max_workers` threads, rate-limited to one call every
+    `sleep_seconds`; parquet writes stay on the calling thread.
     """
     failures = pd.read_csv(failures_csv)
     if failures.empty:
@@ -143,39 +237,43 @@ def refetch_failures(failures_csv: Path, use_paid_key: bool = True, sleep_second
     if not api_key:
         raise ValueError("Alpha Vantage API key missing in credentials.yml")
 
-    rest_client = AlphaVantageRESTClient(api_key=api_key)
+    rest_client = AlphaVantageRESTClient(
+        api_key=api_key,
+        min_interval=sleep_seconds,
+        max_concurrency=max_workers,
+        max_connections=max_workers,
+    )
     base_dir = raw_data_dir()
-    periodized = {"INCOME_STATEMENT", "BALANCE_SHEET", "CASH_FLOW", "EARNINGS", "EARNINGS_ESTIMATES"}
 
-    logger.info("Refetching %d failures from %s", len(failures), failures_csv)
-    for idx, (_, row) in enumerate(failures.iterrows(), start=1):
+    jobs = []
+    for row in failures.to_dict("records"):
         ticker = row.get("ticker") or row.get("symbol")
         endpoint = row.get("function")
         if not ticker or not endpoint:
             continue
+        jobs.append((ticker, endpoint))
+    # failures_all.csv accumulates across transform runs, so the same call is often listed more than once.
+    jobs = list(dict.fromkeys(jobs))
+    total = len(jobs)
+
+    def _fetch(idx: int, ticker: str, endpoint: str) -> pd.DataFrame:
         function = REST_FUNCTION_MAP.get(endpoint, endpoint)
-        logger.info("[%d/%d] Re-fetching %s for %s", idx, len(failures), function, ticker)
-        try:
-            payload = rest_client.fetch_json(function=function, params={"symbol": ticker})
-            df = _json_to_df(payload)
-            if endpoint in periodized:
-                _write_split_by_period(df, base_dir, endpoint, ticker)
-                # Drop stale single-file responses (often the original invalid payload).
-                single_path = base_dir / endpoint / f"{ticker}.parquet"
-                if single_path.exists():
-                    single_path.unlink()
-                    logger.info("Removed stale %s", single_path)
-            else:
-                out_path = base_dir / endpoint / f"{ticker}.parquet"
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                df.to_parquet(out_path, index=False)
-                logger.info("Wrote %d rows to %s", len(df), out_path)
-        except Exception as exc:
-            logger.error("Failed to refetch %s for %s: %s", function, ticker, exc)
-        if sleep_seconds and sleep_seconds > 0:
-            import time
-
-            time.sleep(sleep_seconds)
+        logger.info("[%d/%d] Re-fetching %s for %s", idx, total, function, ticker)
+        payload = rest_client.fetch_json(function=function, params={"symbol": ticker})
+        return _json_to_df(payload)
+
+    logger.info("Refetching %d failures from %s", total, failures_csv)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch, idx, ticker, endpoint): (ticker, endpoint)
+            for idx, (ticker, endpoint) in enumerate(jobs, start=1)
+        }
+        for future in as_completed(futures):
+            ticker, endpoint = futures[future]
+            try:
+                _write_refetched(future.result(), base_dir, endpoint, ticker)
+            except Exception as exc:
+                logger.error("Failed to refetch %s for %s: %s", REST_FUNCTION_MAP.get(endpoint, endpoint), ticker, exc)
 
 
 def clean_final_invalid_calls(dataset: str = "all") -> dict[str, int]:
@@ -191,13 +289,20 @@ def clean_final_invalid_calls(dataset: str = "all") -> dict[str, int]:
         if not path.exists():
             logger.warning("Final dataset not found: %s", path)
             continue
-        df = pd.read_parquet(path)
-        mask = df.astype(str).apply(lambda c: c.str.contains("invalid api call", case=False, na=False)).any(axis=1)
-        count = int(mask.sum())
+        table = _open_parquet(path)
+        mask = _token_mask(table)
+        count = int(pc.sum(mask).as_py() or 0)
         if count == 0:
             continue
-        df = df.loc[~mask].reset_index(drop=True)
-        df.to_parquet(path, index=False)
+        # Write beside the memory-mapped source and swap in, rather than truncating it while mapped.
+        kept = table.filter(pc.invert(mask))
+        del table, mask
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(kept, tmp_path, row_group_size=_ROW_GROUP_ROWS, **_FINAL_WRITE_KW)
+        # Filtered columns can share buffers (e.g. dictionaries) with the mapped source; drop them so
+        # the map is released before the replace (Windows refuses to replace a mapped file).
+        del kept
+        os.replace(tmp_path, path)
         removed[name] = count
         logger.info("Removed %d invalid-api-call rows from %s", count, path)
     if not removed:
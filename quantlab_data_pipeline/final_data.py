@@ -4,31 +4,101 @@ from datetime import date
 from typing import Iterable, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
 
 from .paths import final_dataset_path
 
+# Memory-mapped local reads: Arrow buffers are backed by the page cache instead of a userspace copy.
+_MMAP_FS = fs.LocalFileSystem(use_mmap=True)
+
+
+def _date_scalar(value: date, typ: pa.DataType) -> pa.Scalar:
+    """Arrow scalar for `value` matching a date/timestamp column type."""
+    ts = pd.Timestamp(value)
+    if pa.types.is_date(typ):
+        return pa.scalar(ts.date(), type=typ)
+    if typ.tz:
+        ts = ts.tz_localize(typ.tz)
+    return pa.scalar(ts, type=typ)
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    """Cast dictionary-encoded label columns back to plain strings so pandas gets no Categoricals."""
+    for idx, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(idx, field.name, table.column(idx).cast(field.type.value_type))
+    return table
+
+
+def _and(flt: Optional[ds.Expression], cond: ds.Expression) -> ds.Expression:
+    return cond if flt is None else flt & cond
+
 
 def get_final_data(
     dataset: str = "price_daily",
     tickers: Optional[Iterable[str]] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    columns: Optional[Iterable[str]] = None,
+    dtype_backend: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Load a final dataset with optional filtering (default: price_daily).
+
+    Ticker and date filters are pushed into the parquet scan so non-matching row groups
+    are skipped; `columns` limits which columns are read. Pass dtype_backend="pyarrow"
+    to get Arrow-backed pandas dtypes instead of NumPy/object columns.
     """
-    df = pd.read_parquet(final_dataset_path(dataset))
+    if dtype_backend not in (None, "pyarrow"):
+        raise ValueError(f"Unsupported dtype_backend {dtype_backend!r}; use None or 'pyarrow'.")
+    source = ds.dataset(str(final_dataset_path(dataset)), format="parquet", filesystem=_MMAP_FS)
+    schema = source.schema
+    flt = None
     # Apply common filters when columns exist
-    if tickers and "ticker" in df.columns:
-        df = df[df["ticker"].isin(set(tickers))]
+    if tickers and "ticker" in schema.names:
+        ticker_type = schema.field("ticker").type
+        if pa.types.is_dictionary(ticker_type):
+            ticker_type = ticker_type.value_type
+        # Deduplicated value set typed like the column, so the scan's hash lookup needs no cast.
+        value_set = pa.array(sorted(set(tickers)), type=ticker_type)
+        flt = _and(flt, ds.field("ticker").isin(value_set))
     date_col = None
     for c in ["date", "Date"]:
-        if c in df.columns:
+        if c in schema.names:
             date_col = c
             break
-    if date_col:
+    pandas_date_filter = False
+    if date_col and (start_date or end_date):
+        typ = schema.field(date_col).type
+        if pa.types.is_date(typ) or pa.types.is_timestamp(typ):
+            if start_date:
+                flt = _and(flt, ds.field(date_col) >= _date_scalar(start_date, typ))
+            if end_date:
+                flt = _and(flt, ds.field(date_col) <= _date_scalar(end_date, typ))
+        else:
+            pandas_date_filter = True
+
+    # Snapshot once: `columns` may be a one-shot iterable and is consulted again after the read.
+    requested = list(columns) if columns is not None else None
+    read_cols = list(requested) if requested is not None else None
+    if read_cols is not None and pandas_date_filter and date_col not in read_cols:
+        read_cols.append(date_col)
+    to_pandas_kw = {"types_mapper": pd.ArrowDtype} if dtype_backend == "pyarrow" else {}
+    # Label columns are dictionary-encoded on disk only; decode so filtered frames carry no unused categories.
+    table = _decode_dictionaries(source.to_table(columns=read_cols, filter=flt))
+    df = table.to_pandas(**to_pandas_kw)
+    if pandas_date_filter:
+        # Parse once to datetime64 and compare against Timestamps in a single combined mask.
+        dates = pd.to_datetime(df[date_col], errors="coerce")
+        mask = pd.Series(True, index=df.index)
         if start_date:
-            df = df[df[date_col] >= pd.to_datetime(start_date).date()]
+            mask &= dates >= pd.Timestamp(start_date)
         if end_date:
-            df = df[df[date_col] <= pd.to_datetime(end_date).date()]
-    return df.reset_index(drop=True)
+            mask &= dates <= pd.Timestamp(end_date)
+        df = df.loc[mask].reset_index(drop=True)
+        if requested is not None and date_col not in requested:
+            df = df.drop(columns=[date_col])
+    # Arrow conversion already yields a RangeIndex; only the pandas-filtered path needs a reset.
+    return df
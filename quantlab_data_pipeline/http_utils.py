@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transport-level failures worth retrying; HTTP status codes are handled separately.
+RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+def build_session(pool_size: int = 64) -> requests.Session:
+    """
+    Session with a keep-alive pool of `pool_size` connections per host, so concurrent callers
+    reuse connections instead of discarding them when requests' default pool (10) is full.
+    urllib3 retries are disabled; the clients' own backoff loops are the single retry layer.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=Retry(total=0),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def backoff_delay(attempt: int, initial: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with jitter: initial * 2**attempt plus up to `initial` seconds, capped."""
+    return min(cap, initial * 2**attempt + random.uniform(0, initial))
+
+
+def retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Seconds to wait according to Retry-After or X-RateLimit-* headers, if present."""
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    remaining = resp.headers.get("X-RateLimit-Remaining")
+    reset = resp.headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            if int(float(remaining)) <= 0:
+                reset_val = float(reset)
+                # Reset may be an epoch timestamp or a delta in seconds.
+                return max(0.0, reset_val - time.time()) if reset_val > 1e9 else reset_val
+        except ValueError:
+            pass
+    return None
@@ -2,19 +2,28 @@ from __future__ import annotations
 
 import json
 import logging
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
-import yaml
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+try:  # orjson is an optional speedup; the stdlib parser is used when it is absent.
+    import orjson as _json_impl
+except ImportError:  # pragma: no cover - depends on environment
+    _json_impl = json
 
 from .alpha_vantage_mcp import AlphaVantageMCPClient
 from .alpha_vantage_rest import AlphaVantageRESTClient
-from .config_loader import load_credentials
-from .paths import raw_data_dir, repo_root
-from .wrds_client import fetch_sp500_constituents
+from .config_loader import load_credentials, load_yaml
+from .paths import final_dir, raw_data_dir, repo_root
+from .wrds_client import fetch_ff_factors, fetch_sp500_constituents
 
 logger = logging.getLogger(__name__)
 
@@ -60,41 +69,98 @@ REST_FUNCTION_MAP: Dict[str, str] = {
     "SYMBOL_SEARCH": "SYMBOL_SEARCH",
 }
 
+# Endpoints whose responses carry annual/quarterly reports written to separate folders.
+_PERIODIZED_ENDPOINTS = frozenset(
+    {"INCOME_STATEMENT", "BALANCE_SHEET", "CASH_FLOW", "EARNINGS", "EARNINGS_ESTIMATES"}
+)
+# Request parameter that carries the ticker; endpoints not listed (LISTING_STATUS,
+# EARNINGS_CALENDAR, IPO_CALENDAR) need no symbol.
+_TICKER_PARAM: Dict[str, str] = {
+    **{ep: "symbol" for ep in _PERIODIZED_ENDPOINTS},
+    "COMPANY_OVERVIEW": "symbol",
+    "DIVIDENDS": "symbol",
+    "SPLITS": "symbol",
+    "ETF_PROFILE": "symbol",
+    "SYMBOL_SEARCH": "keywords",
+}
+
+
+# Alpha Vantage numbers its field labels ("1. open", "01. symbol"); the prefix is the text
+# before the first ". " and must be digits and dots with at least one digit.
+_PREFIX_RE = re.compile(r"^(?=[\d.]*\d)[\d.]+?\. (.*)$", re.DOTALL)
+
+
+def _strip_prefix(col: str) -> str:
+    match = _PREFIX_RE.match(col)
+    return match.group(1) if match else col
+
+
+def _loads_json(text: str) -> Any:
+    """JSON decode via orjson when installed, retrying with the stdlib for what orjson rejects."""
+    try:
+        return _json_impl.loads(text)
+    except ValueError:
+        # orjson is strict RFC 8259; json.loads also accepts NaN/Infinity literals.
+        if _json_impl is json:
+            raise
+    return json.loads(text)
+
+
+def _parse_text_payload(text: str) -> Any:
+    """
+    Parse an MCP text payload, which is either JSON or a Python literal (single-quoted repr).
+
+    JSON goes through orjson when installed. A repr with no double quotes anywhere has no
+    embedded quotes in any string, so swapping ' for " yields JSON; only payloads that still
+    fail (True/None literals, escaped quotes) pay for ast.literal_eval.
+    """
+    import ast
+
+    try:
+        return _loads_json(text)
+    except ValueError:
+        pass
+    if '"' not in text and "'" in text:
+        try:
+            return _loads_json(text.replace("'", '"'))
+        except ValueError:
+            pass
+    return ast.literal_eval(text)
+
 
 def _content_to_df(content: Any) -> pd.DataFrame:
     """Normalize MCP content payload into a tidy DataFrame."""
-    import ast
     from io import StringIO
 
     def _maybe_reparse_text_df(df: pd.DataFrame) -> pd.DataFrame:
-        # If we only have a single text column, attempt one more literal_eval pass.
+        # If we only have a single text column, attempt one more parse pass.
         if list(df.columns) == ["text"] and len(df) == 1:
             txt = df.iloc[0, 0]
             try:
-                parsed = ast.literal_eval(txt)
-                return _content_to_df(parsed)
+                return _content_to_df(_parse_text_payload(txt))
             except Exception:
                 return df
         return df
 
-    def _strip_prefix(col: str) -> str:
-        if ". " in col:
-            prefix, rest = col.split(". ", 1)
-            if prefix.replace(".", "").isdigit():
-                return rest
-        return col
+    def _to_numeric_or_keep(col: pd.Series) -> pd.Series:
+        try:
+            return pd.to_numeric(col)
+        except (ValueError, TypeError):
+            return col
 
     def _parse_time_series(payload: Dict[str, Any], meta: Dict[str, Any]) -> pd.DataFrame:
-        records = []
         symbol = meta.get("2. Symbol") or meta.get("1. Symbol")
-        for dt_str, vals in payload.items():
-            rec: Dict[str, Any] = {"date": pd.to_datetime(dt_str).date()}
-            for k, v in vals.items():
-                rec[_strip_prefix(k)] = pd.to_numeric(v, errors="ignore")
-            if symbol:
-                rec["symbol"] = symbol
-            records.append(rec)
-        return pd.DataFrame(records)
+        if not payload:
+            return pd.DataFrame()
+        # Build the frame once from the nested dict and coerce column-wise instead of per cell.
+        df = pd.DataFrame.from_dict(payload, orient="index")
+        df.columns = [_strip_prefix(c) for c in df.columns]
+        df = df.apply(_to_numeric_or_keep)
+        df.insert(0, "date", pd.to_datetime(df.index).date)
+        df = df.reset_index(drop=True)
+        if symbol:
+            df["symbol"] = symbol
+        return df
 
     def _parse_global_quote(payload: Dict[str, Any]) -> pd.DataFrame:
         rec = {_strip_prefix(k): v for k, v in payload.items()}
@@ -103,16 +169,9 @@ def _content_to_df(content: Any) -> pd.DataFrame:
         return pd.DataFrame([rec])
 
     def _try_parse_text(text: str) -> pd.DataFrame:
-        # Try JSON
-        try:
-            parsed = json.loads(text)
-            return _content_to_df(parsed)
-        except json.JSONDecodeError:
-            pass
-        # Try Python literal (since MCP text uses single quotes)
+        # Try JSON, then Python literal (since MCP text uses single quotes)
         try:
-            parsed = ast.literal_eval(text)
-            return _content_to_df(parsed)
+            return _content_to_df(_parse_text_payload(text))
         except Exception:
             pass
         # Then try CSV
@@ -127,8 +186,7 @@ def _content_to_df(content: Any) -> pd.DataFrame:
             # Parse the single text payload into a dict and handle time series
             txt = content[0].get("text", "")
             try:
-                payload = ast.literal_eval(txt)
-                return _content_to_df(payload)
+                return _content_to_df(_parse_text_payload(txt))
             except Exception:
                 frames = [_try_parse_text(txt)]
                 frames = [f for f in frames if not f.empty]
@@ -166,25 +224,61 @@ def _content_to_df(content: Any) -> pd.DataFrame:
     return pd.DataFrame({"value": [content]})
 
 
+_LOCAL_FS = fs.LocalFileSystem()
+
+# zstd-1 compresses about as fast as snappy but smaller; dictionary pages keep repeated
+# ticker/label strings compact, and column statistics let filtered reads skip row groups.
+_PARQUET_WRITE_KW: Dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 1,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+
+
 def _write_parquet(df: pd.DataFrame, path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, index=False)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    try:
+        pq.write_table(table, path, **_PARQUET_WRITE_KW)
+    except FileNotFoundError:
+        # Directories are created once per endpoint; skip the mkdir stat on every other write.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, path, **_PARQUET_WRITE_KW)
     logger.info("Wrote %d rows to %s", len(df), path)
 
 
-def _all_period_files_exist(base_dir: Path, endpoint: str, ticker: str) -> bool:
-    annual_path = base_dir / endpoint / "annual" / f"{ticker}.parquet"
-    quarterly_path = base_dir / endpoint / "quarterly" / f"{ticker}.parquet"
-    if not (annual_path.exists() and quarterly_path.exists()):
-        return False
+def _has_rows(path: Path) -> bool:
+    """True if `path` is a readable parquet with at least one row; reads only the footer."""
     try:
-        a = pd.read_parquet(annual_path)
-        q = pd.read_parquet(quarterly_path)
-        return not a.empty and not q.empty
+        with _LOCAL_FS.open_input_file(str(path)) as f:
+            return pq.ParquetFile(f).metadata.num_rows > 0
     except Exception:
         return False
 
 
+def _parquet_sizes(root: Path) -> Dict[str, int]:
+    """
+    Byte size of every parquet file under `root`, from one batched listing.
+
+    Keys are `Path.as_posix()` strings: Arrow reports forward slashes on every platform, so look
+    paths up with `path.as_posix()` rather than `str(path)`.
+    """
+    selector = fs.FileSelector(str(root), recursive=True, allow_not_found=True)
+    return {
+        Path(info.path).as_posix(): info.size
+        for info in _LOCAL_FS.get_file_info(selector)
+        if info.type == fs.FileType.File and info.path.endswith(".parquet")
+    }
+
+
+def _all_period_files_exist(
+    base_dir: Path, endpoint: str, ticker: str, check: Callable[[Path], bool] = _has_rows
+) -> bool:
+    annual_path = base_dir / endpoint / "annual" / f"{ticker}.parquet"
+    quarterly_path = base_dir / endpoint / "quarterly" / f"{ticker}.parquet"
+    return check(annual_path) and check(quarterly_path)
+
+
 def _write_split_by_period(df: pd.DataFrame, base_dir: Path, endpoint: str, ticker: str) -> None:
     if "period_type" not in df.columns:
         _write_parquet(df, base_dir / endpoint / f"{ticker}.parquet")
@@ -199,8 +293,11 @@ def _write_split_by_period(df: pd.DataFrame, base_dir: Path, endpoint: str, tick
 def _filter_date(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
     for col in ["date", "timestamp", "datetime"]:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col]).dt.date
-            filtered = df[(df[col] >= start) & (df[col] <= end)]
+            ts = pd.to_datetime(df[col])
+            # Compare on datetime64 against Timestamps; `end` is inclusive of the whole day.
+            mask = (ts >= pd.Timestamp(start)) & (ts < pd.Timestamp(end) + pd.Timedelta(days=1))
+            df[col] = ts.dt.date
+            filtered = df[mask]
             # If nothing falls in range (e.g., API returns future dates), keep original to avoid dropping everything.
             return filtered if not filtered.empty else df
     return df
@@ -276,9 +373,13 @@ def run_ingestion(
     tickers_override: Optional[List[str]] = None,
     resume: bool = True,
     fetch_ff: bool = True,
+    max_workers: int = 4,
 ) -> None:
     """
     Ingest WRDS constituents and Alpha Vantage data into raw Parquet files.
+
+    Alpha Vantage calls run on `max_workers` threads, rate-limited to one call every
+    `sleep_seconds` (e.g. 12s for the free tier, ~0.8s for 75 calls/min).
     """
     creds = load_credentials()
     av_key = creds.get("alphavantage_api_paid" if use_paid_key else "alphavantage_api")
@@ -290,7 +391,7 @@ def run_ingestion(
     av_cfg: Dict[str, Any] = {}
     if cfg_path.exists():
         try:
-            cfg = yaml.safe_load(cfg_path.read_text()) or {}
+            cfg = load_yaml(cfg_path) or {}
             av_cfg = cfg.get("alpha_vantage", {})
             defaults = cfg.get("defaults", {})
             ds = defaults.get("start_date")
@@ -331,17 +432,21 @@ def run_ingestion(
         raise ValueError("WRDS credentials missing in credentials.yml")
 
     client = AlphaVantageMCPClient(api_key=av_key, base_url=mcp_base_url)
-    rest_client = AlphaVantageRESTClient(api_key=av_key)
+    rest_client = AlphaVantageRESTClient(
+        api_key=av_key,
+        min_interval=sleep_seconds,
+        max_concurrency=max_workers,
+    )
 
     if tickers_override:
         tickers = sorted(set(tickers_override))
         logger.info("Using provided tickers override (%d tickers); skipping WRDS.", len(tickers))
         dates = pd.date_range(start=date_start, end=date_end, freq="D")
+        # Date-major cross product built as whole columns (no per-row tuples).
+        ticker_col = np.tile(np.asarray(tickers, dtype=object), len(dates))
         constituents = pd.DataFrame(
-            [(d.date(), t) for d in dates for t in tickers],
-            columns=["date", "ticker"],
+            {"date": np.repeat(dates.to_numpy(), len(tickers)), "ticker": ticker_col, "permno": ticker_col}
         )
-        constituents["permno"] = constituents["ticker"]
     else:
         logger.info("Fetching S&P 500 constituents from WRDS")
         try:
@@ -362,10 +467,7 @@ def run_ingestion(
     if fetch_ff:
         try:
             ff_df = fetch_ff_factors(date_start, date_end, wrds_creds["username"], wrds_creds["password"])
-            ff_path = final_dir() / "FAMA_FRENCH_FACTORS.parquet"
-            ff_path.parent.mkdir(parents=True, exist_ok=True)
-            ff_df.to_parquet(ff_path, index=False)
-            logger.info("Wrote %d rows to %s", len(ff_df), ff_path)
+            _write_parquet(ff_df, final_dir() / "FAMA_FRENCH_FACTORS.parquet")
         except Exception as exc:
             logger.warning("Failed to fetch Fama-French factors: %s", exc)
 
@@ -383,83 +485,74 @@ def run_ingestion(
     tickers = sorted(constituents["ticker"].unique())
     _write_parquet(pd.DataFrame({"ticker": tickers}), raw_dir / "wrds_sp500_unique_tickers.parquet")
 
-    # Full history endpoints: call once per ticker when applicable.
+    # Resume checks stat the whole raw tree in one batched listing and test membership in memory
+    # instead of a stat per (ticker, endpoint); only non-empty files get their footer read.
+    sizes = _parquet_sizes(raw_dir) if resume else {}
+
+    def _done(path: Path) -> bool:
+        return sizes.get(path.as_posix(), 0) > 0 and _has_rows(path)
+
+    # Build the full job list first, then fetch concurrently; the client's rate limiter keeps the
+    # pool within the API quota so one request's latency overlaps another's wait.
+    jobs: List[tuple] = []
+    # Endpoint handling depends only on the config, so resolve it once rather than per ticker.
+    endpoint_specs = [
+        (
+            endpoint,
+            REST_FUNCTION_MAP.get(endpoint, endpoint),
+            _TICKER_PARAM.get(endpoint),
+            endpoint in _PERIODIZED_ENDPOINTS,
+        )
+        for endpoint in full_history_endpoints
+    ]
     for ticker in tickers:
         for endpoint in time_series_endpoints:
             # Use direct REST call for full CSV without preview truncation.
-            function = endpoint
             out_path = raw_dir / endpoint / f"{ticker}.parquet"
-            if resume and out_path.exists():
-                try:
-                    existing = pd.read_parquet(out_path)
-                    if not existing.empty:
-                        logger.info("Skipping %s %s (resume enabled, file already exists)", endpoint, ticker)
-                        continue
-                except Exception:
-                    pass
-            df = rest_client.fetch_time_series_csv(function=function, symbol=ticker, outputsize="full")
-            df = _filter_date(df, date_start, date_end)
-            _write_parquet(df, out_path)
-            time.sleep(sleep_seconds)
-
-        for endpoint in full_history_endpoints:
-            params: Dict[str, Any] = {}
-            function = REST_FUNCTION_MAP.get(endpoint, endpoint)
-            out_path = raw_dir / endpoint / f"{ticker}.parquet"
-            periodized = endpoint in {
-                "INCOME_STATEMENT",
-                "BALANCE_SHEET",
-                "CASH_FLOW",
-                "EARNINGS",
-                "EARNINGS_ESTIMATES",
-            }
+            if resume and _done(out_path):
+                logger.info("Skipping %s %s (resume enabled, file already exists)", endpoint, ticker)
+                continue
+            jobs.append(("csv", endpoint, endpoint, {"symbol": ticker}, ticker, False))
+
+        for endpoint, function, ticker_param, periodized in endpoint_specs:
             if resume:
-                if periodized and _all_period_files_exist(raw_dir, endpoint, ticker):
+                if periodized and _all_period_files_exist(raw_dir, endpoint, ticker, _done):
                     logger.info("Skipping %s %s (resume enabled, annual+quarterly exist)", endpoint, ticker)
                     continue
-                if (not periodized) and out_path.exists():
-                    try:
-                        existing = pd.read_parquet(out_path)
-                        if not existing.empty:
-                            logger.info("Skipping %s %s (resume enabled, file already exists)", endpoint, ticker)
-                            continue
-                    except Exception:
-                        pass
-            if endpoint in {
-                "COMPANY_OVERVIEW",
-                "INCOME_STATEMENT",
-                "BALANCE_SHEET",
-                "CASH_FLOW",
-                "EARNINGS",
-                "EARNINGS_ESTIMATES",
-                "DIVIDENDS",
-                "SPLITS",
-                "ETF_PROFILE",
-            }:
-                params["symbol"] = ticker
-            elif endpoint == "SYMBOL_SEARCH":
-                params["keywords"] = ticker
-            # LISTING_STATUS, EARNINGS_CALENDAR, IPO_CALENDAR need no symbol.
-
-            payload = rest_client.fetch_json(function=function, params=params)
-            df = _filter_date(_json_to_df(payload), date_start, date_end)
-            _write_split_by_period(df, raw_dir, endpoint, ticker)
-            time.sleep(sleep_seconds)
-
+                if (not periodized) and _done(raw_dir / endpoint / f"{ticker}.parquet"):
+                    logger.info("Skipping %s %s (resume enabled, file already exists)", endpoint, ticker)
+                    continue
+            params: Dict[str, Any] = {ticker_param: ticker} if ticker_param else {}
+            jobs.append(("json", endpoint, function, params, ticker, True))
 
     # Economic indicators: single calls without ticker.
     for endpoint in economic_endpoints:
         function = REST_FUNCTION_MAP.get(endpoint, endpoint)
         out_path = raw_dir / endpoint / "global.parquet"
-        if resume and out_path.exists():
-            try:
-                existing = pd.read_parquet(out_path)
-                if not existing.empty:
-                    logger.info("Skipping %s (resume enabled, file already exists)", endpoint)
-                    continue
-            except Exception:
-                pass
-        payload = rest_client.fetch_json(function=function, params={})
-        df = _filter_date(_json_to_df(payload), date_start, date_end)
-        _write_parquet(df, out_path)
-        time.sleep(sleep_seconds)
+        if resume and _done(out_path):
+            logger.info("Skipping %s (resume enabled, file already exists)", endpoint)
+            continue
+        jobs.append(("json", endpoint, function, {}, "global", False))
+
+    def _run_job(kind: str, endpoint: str, function: str, params: Dict[str, Any], name: str, split: bool) -> None:
+        if kind == "csv":
+            df = rest_client.fetch_time_series_csv(function=function, symbol=params["symbol"], outputsize="full")
+        else:
+            df = _json_to_df(rest_client.fetch_json(function=function, params=params))
+        df = _filter_date(df, date_start, date_end)
+        if split:
+            _write_split_by_period(df, raw_dir, endpoint, name)
+        else:
+            _write_parquet(df, raw_dir / endpoint / f"{name}.parquet")
+
+    logger.info("Fetching %d Alpha Vantage calls with %d workers", len(jobs), max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_job, *job) for job in jobs]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Preserve fail-fast behaviour: drop queued calls, let in-flight ones finish, re-raise.
+            for future in futures:
+                future.cancel()
+            raise
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
 from .paths import final_dataset_path, final_dir
 
 logger = logging.getLogger(__name__)
 
 
-def _missing_detail(df: pd.DataFrame, top_n: int = 10) -> List[str]:
-    total = len(df)
+def _missing_detail(na_counts: pd.Series, total: int, top_n: int = 10) -> List[str]:
     if total == 0:
         return []
-    na_counts = df.isna().sum()
     nonzero = na_counts[na_counts > 0].sort_values(ascending=False)
     details = []
     for col, cnt in nonzero.head(top_n).items():
@@ -23,16 +23,39 @@ def _missing_detail(df: pd.DataFrame, top_n: int = 10) -> List[str]:
     return details
 
 
-def _load_dataset(name: str) -> pd.DataFrame:
-    return pd.read_parquet(final_dataset_path(name))
+# Columns the price consistency/bounds checks read; always loaded when present.
+_CHECK_COLUMNS = ("open", "high", "low", "close", "volume")
 
 
-def run_quality_checks(dataset: str = "price_daily", top_missing: int = 10) -> Dict[str, Dict[str, List[str]]]:
+def _load_dataset(name: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    path = final_dataset_path(name)
+    read_cols = None
+    if columns is not None:
+        # Keep file order and silently skip names this dataset does not have.
+        wanted = set(columns)
+        read_cols = [c for c in pq.read_schema(path).names if c in wanted]
+    return pq.read_table(path, columns=read_cols).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _values(col: pd.Series) -> np.ndarray:
+    """Column as a float64 array (NA -> NaN) so comparisons run as plain NumPy ufuncs."""
+    if not pd.api.types.is_numeric_dtype(col):
+        col = pd.to_numeric(col, errors="coerce")
+    return col.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def run_quality_checks(
+    dataset: str = "price_daily",
+    top_missing: int = 10,
+    columns: Optional[Iterable[str]] = None,
+) -> Dict[str, Dict[str, List[str]]]:
     """
     Quality checks on final datasets.
 
     - If `dataset` is a specific name (e.g., price_daily), runs checks on that dataset.
     - If `dataset` == "all", scans every parquet in the final dir.
+    - `columns` limits which columns are read (and so the missing-value report); the
+      price check columns are always included when the dataset has them.
     Returns a dict keyed by dataset with lists for missing/consistency/bounds/missing_detail.
     """
     datasets: List[str]
@@ -41,35 +64,42 @@ def run_quality_checks(dataset: str = "price_daily", top_missing: int = 10) -> D
     else:
         datasets = [dataset]
 
+    read_cols = None if columns is None else set(columns).union(_CHECK_COLUMNS)
     reports: Dict[str, Dict[str, List[str]]] = {}
     for ds in datasets:
         try:
-            df = _load_dataset(ds)
+            df = _load_dataset(ds, read_cols)
         except FileNotFoundError:
             logger.warning("Dataset %s not found in final_dir", ds)
             continue
         issues: Dict[str, List[str]] = {"missing": [], "consistency": [], "bounds": [], "missing_detail": []}
 
         # Common: missing values
-        if df.isna().any().any():
-            issues["missing"].append(f"Rows with any missing values: {int(df.isna().any(axis=1).sum())}")
-            issues["missing_detail"] = _missing_detail(df, top_missing)
+        # Build the NA mask once and derive the any/row/per-column figures from it.
+        na = df.isna()
+        na_counts = na.sum()
+        if na_counts.any():
+            issues["missing"].append(f"Rows with any missing values: {int(na.any(axis=1).sum())}")
+            issues["missing_detail"] = _missing_detail(na_counts, len(df), top_missing)
 
         # Price-specific consistency/bounds
         required_cols = {"open", "high", "low", "close"}
         if "date" in df.columns:
             df["date"] = pd.to_datetime(df["date"], errors="coerce").dt.date
+        # One boolean scratch buffer shared by every comparison instead of a fresh temp per mask.
+        mask = np.empty(len(df), dtype=bool)
         if required_cols.issubset(df.columns):
-            bad_open_high = df[df["open"] > df["high"]]
-            bad_low_close = df[df["low"] > df["close"]]
-            if not bad_open_high.empty:
-                issues["consistency"].append(f"open>high rows: {len(bad_open_high)}")
-            if not bad_low_close.empty:
-                issues["consistency"].append(f"low>close rows: {len(bad_low_close)}")
+            # Count violations straight off the arrays; no filtered DataFrames are built.
+            n_open_high = int(np.count_nonzero(np.greater(_values(df["open"]), _values(df["high"]), out=mask)))
+            n_low_close = int(np.count_nonzero(np.greater(_values(df["low"]), _values(df["close"]), out=mask)))
+            if n_open_high:
+                issues["consistency"].append(f"open>high rows: {n_open_high}")
+            if n_low_close:
+                issues["consistency"].append(f"low>close rows: {n_low_close}")
         if "volume" in df.columns:
-            negative = df[df["volume"] < 0]
-            if not negative.empty:
-                issues["bounds"].append(f"Negative volume values: {len(negative)} rows")
+            n_negative = int(np.count_nonzero(np.less(_values(df["volume"]), 0, out=mask)))
+            if n_negative:
+                issues["bounds"].append(f"Negative volume values: {n_negative} rows")
 
         reports[ds] = issues
 
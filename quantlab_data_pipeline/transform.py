@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pandas.tseries.offsets import BusinessDay
 
 from .paths import data_root, final_dataset_path, final_dir, raw_data_dir
@@ -31,10 +36,58 @@ _PRICE_FIELDS = {
     "8. split coefficient": "split_coefficient",
 }
 _PRICE_COLS = ["date", "open", "high", "low", "close", "adjusted_close", "volume", "dividend_amount", "split_coefficient"]
+# Fixed layout of the price tables so per-file frames can be streamed into one parquet file.
+_PRICE_SCHEMA = pa.schema(
+    [("date", pa.date32())]
+    + [(c, pa.int64() if c == "volume" else pa.float64()) for c in _PRICE_COLS[1:]]
+    + [("ticker", pa.dictionary(pa.int32(), pa.large_string()))]
+)
 _WIDE_PREFIXES = (
     "Time Series (Daily)",
     "Weekly Adjusted Time Series",
 )
+_FUNDAMENTALS_ENDPOINTS = frozenset(
+    {
+        "INCOME_STATEMENT",
+        "BALANCE_SHEET",
+        "CASH_FLOW",
+        "EARNINGS",
+        "EARNINGS_ESTIMATES",
+        "DIVIDENDS",
+        "SPLITS",
+    }
+)
+_ECON_ENDPOINTS = frozenset(
+    {
+        "REAL_GDP",
+        "REAL_GDP_PER_CAPITA",
+        "TREASURY_YIELD",
+        "FEDERAL_FUNDS_RATE",
+        "CPI",
+        "INFLATION",
+        "RETAIL_SALES",
+        "DURABLES",
+        "UNEMPLOYMENT",
+        "NONFARM_PAYROLL",
+    }
+)
+# Period sub-directories of periodized raw endpoints.
+_PERIOD_TYPES = frozenset({"annual", "quarterly"})
+_PRICE_ENDPOINTS = {
+    "TIME_SERIES_DAILY_ADJUSTED": "price_daily",
+    "TIME_SERIES_WEEKLY_ADJUSTED": "price_weekly",
+}
+# Raw columns a long-format price file can contribute: date candidates, price fields under either
+# spelling, and the API error columns the failure scan looks at.
+_PRICE_SOURCE_COLUMNS = frozenset(
+    ["date", "Date", "timestamp", "datetime", "adjusted close", "dividend amount", "split coefficient"]
+    + _PRICE_COLS[1:]
+    + ["Information", "Error Message", "Note"]
+)
+# Column-label patterns ("<prefix>.<YYYY-MM-DD>.<n>. <label>") compiled once per prefix.
+_PATTERNS = {
+    p: re.compile(rf"^{re.escape(p)}\.(\d{{4}}-\d{{2}}-\d{{2}})\.(\d+)\.\s(.+)$") for p in _WIDE_PREFIXES
+}
 
 
 def _unpivot_alpha_vantage_timeseries(df: pd.DataFrame, ticker: str) -> Optional[pd.DataFrame]:
@@ -46,29 +99,37 @@ def _unpivot_alpha_vantage_timeseries(df: pd.DataFrame, ticker: str) -> Optional
     if not prefix:
         return None
 
-    pattern = re.compile(rf"^{re.escape(prefix)}\.(\d{{4}}-\d{{2}}-\d{{2}})\.(\d+)\.\s(.+)$")
-    row = df.iloc[0]
-    grouped: Dict[str, Dict[str, object]] = {}
-    for col in cols:
-        match = pattern.match(col)
-        if not match:
-            continue
-        date_str, num, label = match.groups()
-        field = _PRICE_FIELDS.get(f"{num}. {label}".strip())
-        if not field:
-            continue
-        grouped.setdefault(date_str, {})[field] = row[col]
-
-    if not grouped:
+    # Parse every column label in one vectorized pass instead of a Python regex loop.
+    parts = pd.Series(cols).str.extract(_PATTERNS[prefix])
+    fields = (parts[1] + ". " + parts[2]).str.strip().map(_PRICE_FIELDS)
+    valid = parts[0].notna() & fields.notna()
+    if not valid.any():
         return None
 
-    records = []
-    for date_str, values in grouped.items():
-        values["date"] = date_str
-        values["ticker"] = ticker
-        records.append(values)
-
-    return pd.DataFrame.from_records(records)
+    long = pd.DataFrame(
+        {"date": parts[0][valid], "field": fields[valid], "value": df.iloc[0].to_numpy()[valid.to_numpy()]}
+    )
+    # Dates/fields keep first-seen order and later duplicates win, matching the payload layout.
+    date_order, field_order = long["date"].unique(), long["field"].unique()
+    long = long.drop_duplicates(["date", "field"], keep="last")
+    wide = long.pivot(index="date", columns="field", values="value")
+    wide = wide.reindex(index=date_order, columns=field_order)
+    wide.columns.name = None
+    wide = wide.rename_axis("date").reset_index()
+    wide = wide[[c for c in wide.columns if c != "date"] + ["date"]]
+    wide["ticker"] = ticker
+    return wide
+
+
+def _price_read_columns(names: list[str]) -> Optional[list[str]]:
+    """Columns of a raw price file worth reading, or None to read it whole."""
+    # Wide flattened payloads have dynamic column names, and files without a date column fall back
+    # to the first column in _normalize_price; both need every column.
+    if not any(c in names for c in ("date", "Date", "timestamp", "datetime")):
+        return None
+    if any(c.startswith(p + ".") for c in names for p in _WIDE_PREFIXES):
+        return None
+    return [c for c in names if c in _PRICE_SOURCE_COLUMNS]
 
 
 def _normalize_price(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
@@ -76,7 +137,7 @@ def _normalize_price(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
     if wide_df is not None:
         df = wide_df
     else:
-        df = df.copy()
+        # No defensive copy: the rename below always returns a new frame before any column is set.
         date_col = _infer_date_column(df)
         if date_col:
             df = df.rename(columns={date_col: "date"})
@@ -94,23 +155,265 @@ def _normalize_price(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
         }
     )
     df["ticker"] = ticker
-    df["date"] = pd.to_datetime(df["date"], errors="coerce", format="ISO8601").dt.date
-    for col in ("open", "high", "low", "close", "adjusted_close", "volume", "dividend_amount", "split_coefficient"):
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Values keep their raw types here; _price_table coerces them to _PRICE_SCHEMA in Arrow.
     keep = [col for col in _PRICE_COLS + ["ticker"] if col in df.columns]
     return df[keep]
 
 
-def _write(df: pd.DataFrame, name: str) -> Path:
-    path = final_dataset_path(name)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(path, index=False)
-    logger.info("Wrote %d rows to %s", len(df), path)
-    return path
+# Label columns repeated on every row of a file; stored dictionary-encoded (int32 codes).
+_LABEL_COLUMNS = ("ticker", "statement", "period_type", "indicator")
+
 
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for name in _LABEL_COLUMNS:
+        idx = table.schema.get_field_index(name)
+        if idx < 0:
+            continue
+        typ = table.schema.field(idx).type
+        if pa.types.is_string(typ) or pa.types.is_large_string(typ):
+            table = table.set_column(idx, name, pc.dictionary_encode(table.column(idx)))
+    return table
+
+
+def _unified_schema(parts: list[pa.Table]) -> pa.Schema:
+    """Union of the parts' columns with types promoted across files."""
+    try:
+        schema = pa.unify_schemas([t.schema for t in parts], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Some column's types conflict across files (e.g. numeric vs text); settle field by field and
+        # keep irreconcilable columns as text.
+        fields: Dict[str, pa.Field] = {}
+        for t in parts:
+            for f in t.schema:
+                prev = fields.get(f.name)
+                if prev is None:
+                    fields[f.name] = f
+                    continue
+                if prev.type == f.type:
+                    continue
+                try:
+                    fields[f.name] = pa.unify_schemas(
+                        [pa.schema([prev]), pa.schema([f])], promote_options="permissive"
+                    ).field(0)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    fields[f.name] = pa.field(f.name, pa.large_string())
+        schema = pa.schema(list(fields.values()))
+    # Per-file pandas metadata does not describe the union; drop it.
+    return schema.remove_metadata()
+
+
+def _align(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder/cast `table` to `schema`, filling columns it lacks with nulls."""
+    names = set(table.column_names)
+    columns = [
+        table.column(f.name).cast(f.type) if f.name in names else pa.nulls(table.num_rows, f.type) for f in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _drain_aligned(parts: list[pa.Table], schema: pa.Schema) -> Iterator[pa.Table]:
+    """Yield each part aligned to `schema`, releasing the original as soon as it is consumed."""
+    for i in range(len(parts)):
+        part, parts[i] = parts[i], None
+        yield _align(part, schema)
+
+
+def _price_column(values: pd.Series, typ: pa.DataType) -> pa.Array:
+    """
+    Coerce one raw price column to `typ`, turning unparseable values into nulls.
 
-def transform_raw_to_final() -> Dict[str, Path]:
+    Arrow casts (and strptime for ISO date strings) handle clean columns in one vectorized call;
+    anything they reject goes through pd.to_datetime/pd.to_numeric with errors="coerce".
+    """
+    try:
+        arr = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = None  # mixed Python objects, e.g. numbers next to strings
+    if arr is not None:
+        if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+            if pa.types.is_date(typ):
+                parsed = pc.strptime(arr, format="%Y-%m-%d", unit="s", error_is_null=True)
+                if parsed.null_count == arr.null_count:
+                    return parsed.cast(typ)
+            else:
+                try:
+                    return pc.cast(arr, typ)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    pass
+        else:
+            try:
+                # Volumes are whole share counts; safe=False lets float-widened columns land in int64.
+                return arr.cast(typ, safe=False)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                pass
+    if pa.types.is_date(typ):
+        values = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    else:
+        values = pd.to_numeric(values, errors="coerce")
+    return pa.array(values, from_pandas=True).cast(typ, safe=False)
+
+
+def _price_table(df: pd.DataFrame) -> pa.Table:
+    """Normalized price frame as a `_PRICE_SCHEMA` table, dropping rows without a date."""
+    columns = []
+    for field in _PRICE_SCHEMA:
+        if field.name == "ticker":
+            columns.append(pa.array(df["ticker"]).cast(field.type))
+        elif field.name in df.columns:
+            columns.append(_price_column(df[field.name], field.type))
+        else:
+            columns.append(pa.nulls(len(df), field.type))
+    table = pa.Table.from_arrays(columns, schema=_PRICE_SCHEMA)
+    return table.filter(pc.is_valid(table["date"]))
+
+
+# Final tables are written once and scanned many times: zstd compresses them well at little read
+# cost, and ~1M-row row groups keep scans from paying per-group overhead on every ticker.
+_FINAL_WRITE_KW: Dict[str, Any] = {"compression": "zstd", "compression_level": 3}
+_ROW_GROUP_ROWS = 1_000_000
+
+
+class _StreamingWriter:
+    """Append same-schema tables to one final parquet file as they are produced."""
+
+    def __init__(self, name: str, schema: pa.Schema) -> None:
+        self.name = name
+        self.schema = schema
+        self.path = final_dataset_path(name)
+        self._tmp_path = self.path.with_suffix(".parquet.tmp")
+        self._writer: Optional[pq.ParquetWriter] = None
+        # Per-file tables are small; buffer them so each row group holds ~_ROW_GROUP_ROWS rows.
+        self._pending: list[pa.Table] = []
+        self._pending_rows = 0
+        self.rows = 0
+
+    def write_table(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        self.rows += table.num_rows
+        if self._pending_rows >= _ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        if self._writer is None:
+            self._tmp_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._tmp_path, self.schema, **_FINAL_WRITE_KW)
+        self._writer.write_table(pa.concat_tables(self._pending), row_group_size=_ROW_GROUP_ROWS)
+        self._pending = []
+        self._pending_rows = 0
+
+    def close(self) -> Optional[Path]:
+        """Finish the file and move it into place; returns None if nothing was written."""
+        self._flush()
+        if self._writer is None:
+            return None
+        self._writer.close()
+        os.replace(self._tmp_path, self.path)
+        logger.info("Wrote %d rows to %s", self.rows, self.path)
+        return self.path
+
+
+# Per-endpoint routing of a normalized raw frame: handler(df, endpoint, ticker, period_type)
+# returns (output, payload) for the final table it belongs to.
+def _handle_price(df: pd.DataFrame, endpoint: str, ticker: str, period_type: Optional[str]) -> Tuple[str, Any]:
+    return _PRICE_ENDPOINTS[endpoint], _price_table(_normalize_price(df, ticker))
+
+
+def _handle_fundamentals(
+    df: pd.DataFrame, endpoint: str, ticker: str, period_type: Optional[str]
+) -> Tuple[str, Any]:
+    df["ticker"] = ticker
+    df["statement"] = endpoint
+    if period_type:
+        df["period_type"] = period_type
+    return "fundamentals", (endpoint, _to_table(df))
+
+
+def _handle_econ(df: pd.DataFrame, endpoint: str, ticker: str, period_type: Optional[str]) -> Tuple[str, Any]:
+    df["indicator"] = endpoint
+    return "economic_indicators", _to_table(df)
+
+
+def _handle_overview(df: pd.DataFrame, endpoint: str, ticker: str, period_type: Optional[str]) -> Tuple[str, Any]:
+    df["ticker"] = ticker
+    return "company_overview", _to_table(df)
+
+
+_HANDLERS = {
+    **dict.fromkeys(_PRICE_ENDPOINTS, _handle_price),
+    **dict.fromkeys(_FUNDAMENTALS_ENDPOINTS, _handle_fundamentals),
+    **dict.fromkeys(_ECON_ENDPOINTS, _handle_econ),
+    "COMPANY_OVERVIEW": _handle_overview,
+}
+
+
+def _walk_parquet(root: str) -> Iterator[str]:
+    """Parquet file paths under `root` as strings, in the same order as Path.rglob."""
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".parquet"):
+                yield entry.path
+    for sub in subdirs:
+        yield from _walk_parquet(sub)
+
+
+def _transform_file(path: str) -> Optional[Tuple[str, Any]]:
+    """
+    Read and normalize one raw parquet file (runs in a worker process).
+
+    Returns ("failure", record) for API error payloads, (output, table) for data routed to a
+    final table (("fundamentals", (statement, table)) for fundamentals), or None for skipped files.
+    """
+    parent_dir, name = os.path.split(path)
+    if name.startswith("wrds_"):
+        return None
+    grandparent_dir, parent = os.path.split(parent_dir)
+    grandparent = os.path.basename(grandparent_dir)
+    endpoint = grandparent if parent in _PERIOD_TYPES else parent
+    ticker = os.path.splitext(name)[0]
+    # ParquetFile reads the single file directly; pq.read_table would set up dataset discovery
+    # (path inspection, partitioning, fragment planning) for every raw file.
+    pf = pq.ParquetFile(path, memory_map=True)
+    # Price files only keep the price fields; the footer schema tells which columns to skip reading.
+    columns = _price_read_columns(pf.schema_arrow.names) if endpoint in _PRICE_ENDPOINTS else None
+    df = pf.read(columns=columns).to_pandas(split_blocks=True, self_destruct=True)
+    if df.empty:
+        return None
+
+    # Detect API error/rate-limit payloads and log as failures, then skip.
+    df_str = df.astype(str)
+    err_mask = df_str.apply(
+        lambda c: c.str.contains("invalid api call|thank you for using alpha vantage", case=False, na=False)
+    ).any(axis=1)
+    only_info_cols = set(df.columns) <= {"Information", "Error Message", "Note"}
+    if err_mask.any() or only_info_cols:
+        endpoint = parent if parent not in _PERIOD_TYPES else grandparent
+        return (
+            "failure",
+            {
+                "ticker": ticker,
+                "function": endpoint,
+                "path": path,
+                "error_sample": df_str.stack().iloc[0] if not df_str.empty else "",
+            },
+        )
+
+    handler = _HANDLERS.get(endpoint)
+    if handler is None:
+        return None
+    period_type = parent if parent in _PERIOD_TYPES else grandparent if grandparent in _PERIOD_TYPES else None
+    return handler(df, endpoint, ticker, period_type)
+
+
+def transform_raw_to_final(max_workers: Optional[int] = None) -> Dict[str, Path]:
     """
     Build domain-specific final tables:
       - price_daily: from TIME_SERIES_DAILY_ADJUSTED
@@ -118,150 +421,104 @@ def transform_raw_to_final() -> Dict[str, Path]:
       - fundamentals: all fundamentals endpoints, preserving period_type when present
       - economic_indicators: all economic indicator endpoints
       - company_overview: single-row metadata per ticker (from COMPANY_OVERVIEW)
+
+    Raw files are read and normalized in parallel on `max_workers` processes (default: CPU
+    count); results are written in file order from the main process.
     """
     raw_dir = raw_data_dir()
-    paths = list(raw_dir.rglob("*.parquet"))
+    # Plain strings from os.scandir: no Path object per raw file in the main process.
+    paths = list(_walk_parquet(str(raw_dir))) if raw_dir.is_dir() else []
     if not paths:
         raise FileNotFoundError(f"No parquet files found under {raw_dir}")
 
-    price_daily, price_weekly = [], []
-    fundamentals_map: Dict[str, list[pd.DataFrame]] = {}
+    # Price tables are streamed to disk as results arrive; at most one row group is held at a time.
+    price_daily = _StreamingWriter("price_daily", _PRICE_SCHEMA)
+    price_weekly = _StreamingWriter("price_weekly", _PRICE_SCHEMA)
+    fundamentals_map: Dict[str, list[pa.Table]] = {}
     econ = []
     company_overview = []
     failures = []
 
-    fundamentals_endpoints = {
-        "INCOME_STATEMENT",
-        "BALANCE_SHEET",
-        "CASH_FLOW",
-        "EARNINGS",
-        "EARNINGS_ESTIMATES",
-        "DIVIDENDS",
-        "SPLITS",
-    }
-    econ_endpoints = {
-        "REAL_GDP",
-        "REAL_GDP_PER_CAPITA",
-        "TREASURY_YIELD",
-        "FEDERAL_FUNDS_RATE",
-        "CPI",
-        "INFLATION",
-        "RETAIL_SALES",
-        "DURABLES",
-        "UNEMPLOYMENT",
-        "NONFARM_PAYROLL",
+    # Where each worker output goes, keyed by the output name returned from _transform_file.
+    sinks = {
+        "failure": failures.append,
+        "price_daily": price_daily.write_table,
+        "price_weekly": price_weekly.write_table,
+        "fundamentals": lambda payload: fundamentals_map.setdefault(payload[0], []).append(payload[1]),
+        "economic_indicators": econ.append,
+        "company_overview": company_overview.append,
     }
 
     total = len(paths)
     logger.info("Transforming %d raw files from %s", total, raw_dir)
 
-    for idx, path in enumerate(paths, start=1):
-        if path.name.startswith("wrds_"):
-            continue
-        parent = path.parent.name
-        grandparent = path.parent.parent.name if path.parent.parent else ""
-        endpoint = grandparent if parent in {"annual", "quarterly"} else parent
-        ticker = path.stem
-        df = pd.read_parquet(path)
-        if df.empty:
-            continue
-
-        if idx % 50 == 0 or idx == total:
-            logger.info("Processed %d/%d files...", idx, total)
-
-        # Detect API error/rate-limit payloads and log as failures, then skip.
-        df_str = df.astype(str)
-        err_mask = df_str.apply(
-            lambda c: c.str.contains("invalid api call|thank you for using alpha vantage", case=False, na=False)
-        ).any(axis=1)
-        only_info_cols = set(df.columns) <= {"Information", "Error Message", "Note"}
-        if err_mask.any() or only_info_cols:
-            endpoint = parent if parent not in {"annual", "quarterly"} else path.parent.parent.name
-            failures.append(
-                {
-                    "ticker": ticker,
-                    "function": endpoint,
-                    "path": str(path),
-                    "error_sample": df_str.stack().iloc[0] if not df_str.empty else "",
-                }
-            )
-            continue
-
-        if endpoint == "TIME_SERIES_DAILY_ADJUSTED":
-            price_daily.append(_normalize_price(df, ticker))
-            continue
-        if endpoint == "TIME_SERIES_WEEKLY_ADJUSTED":
-            price_weekly.append(_normalize_price(df, ticker))
-            continue
-
-        if endpoint in fundamentals_endpoints:
-            period_type = None
-            if parent in ("annual", "quarterly"):
-                period_type = parent
-            elif grandparent in ("annual", "quarterly"):
-                period_type = grandparent
-            df = df.copy()
-            df["ticker"] = ticker
-            statement = endpoint
-            df["statement"] = statement
-            if period_type:
-                df["period_type"] = period_type
-            fundamentals_map.setdefault(statement, []).append(df)
-            continue
-
-        if endpoint in econ_endpoints:
-            df = df.copy()
-            df["indicator"] = endpoint
-            econ.append(df)
-            continue
-
-        if endpoint == "COMPANY_OVERVIEW":
-            df = df.copy()
-            df["ticker"] = ticker
-            company_overview.append(df)
-            continue
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        results = executor.map(_transform_file, paths, chunksize=16)
+        for idx, result in enumerate(results, start=1):
+            if idx % 50 == 0 or idx == total:
+                logger.info("Processed %d/%d files...", idx, total)
+            if result is None:
+                continue
+            output, payload = result
+            sinks[output](payload)
 
     outputs: Dict[str, Path] = {}
     final_dir().mkdir(parents=True, exist_ok=True)
 
-    if price_daily:
-        daily_df = pd.concat(price_daily, ignore_index=True)
-        daily_df = daily_df.dropna(subset=["date"])
-        outputs["price_daily"] = _write(daily_df, "price_daily")
-    else:
-        logger.info("No price_daily data assembled.")
-    if price_weekly:
-        weekly_df = pd.concat(price_weekly, ignore_index=True)
-        weekly_df = weekly_df.dropna(subset=["date"])
-        outputs["price_weekly"] = _write(weekly_df, "price_weekly")
-    else:
-        logger.info("No price_weekly data assembled.")
+    for writer in (price_daily, price_weekly):
+        path = writer.close()
+        if path is not None:
+            outputs[writer.name] = path
+        else:
+            logger.info("No %s data assembled.", writer.name)
     for statement, parts in fundamentals_map.items():
-        stmt_df = pd.concat(parts, ignore_index=True)
-        if "Information" in stmt_df.columns:
-            stmt_df = stmt_df.drop(columns=["Information"])
         base_name = f"fundamentals_{statement.lower()}"
-
-        outputs[base_name] = _write(stmt_df, base_name)
-        if "period_type" in stmt_df.columns:
-            for period in ["quarterly", "annual"]:
-                sub = stmt_df[stmt_df["period_type"] == period].copy()
-                if sub.empty:
-                    continue
-                outputs[f"{base_name}_{period}"] = _write(sub, f"{base_name}_{period}")
+        schema = _unified_schema(parts)
+        if "Information" in schema.names:
+            schema = schema.remove(schema.get_field_index("Information"))
+        writer = _StreamingWriter(base_name, schema)
+        period_writers: Dict[str, _StreamingWriter] = {}
+        if "period_type" in schema.names:
+            period_writers = {p: _StreamingWriter(f"{base_name}_{p}", schema) for p in ("quarterly", "annual")}
+        for part in _drain_aligned(parts, schema):
+            writer.write_table(part)
+            for period, period_writer in period_writers.items():
+                period_writer.write_table(part.filter(pc.equal(part["period_type"], period)))
+        path = writer.close()
+        if path is not None:
+            outputs[base_name] = path
+        for period_writer in period_writers.values():
+            path = period_writer.close()
+            if path is not None:
+                outputs[period_writer.name] = path
     if not fundamentals_map:
         logger.info("No fundamentals data assembled.")
     if econ:
-        outputs["economic_indicators"] = _write(pd.concat(econ, ignore_index=True), "economic_indicators")
+        parts, schema = econ, _unified_schema(econ)
+        writer = _StreamingWriter("economic_indicators", schema)
+        for part in _drain_aligned(parts, schema):
+            writer.write_table(part)
+        path = writer.close()
+        if path is not None:
+            outputs["economic_indicators"] = path
     else:
         logger.info("No economic indicator data assembled.")
     if company_overview:
-        co_df = pd.concat(company_overview, ignore_index=True)
+        parts, schema = company_overview, _unified_schema(company_overview)
         # Drop noise columns that only hold error text/nulls (e.g., "Error Message") or are entirely empty.
-        drop_cols = [c for c in co_df.columns if c == "Error Message" or co_df[c].notna().sum() == 0]
-        if drop_cols:
-            co_df = co_df.drop(columns=drop_cols)
-        outputs["company_overview"] = _write(co_df, "company_overview")
+        total_rows = sum(t.num_rows for t in parts)
+        null_counts = dict.fromkeys(schema.names, 0)
+        for t in parts:
+            for name in schema.names:
+                null_counts[name] += t.column(name).null_count if name in t.column_names else t.num_rows
+        keep = [f for f in schema if f.name != "Error Message" and null_counts[f.name] < total_rows]
+        schema = pa.schema(keep)
+        writer = _StreamingWriter("company_overview", schema)
+        for part in _drain_aligned(parts, schema):
+            writer.write_table(part)
+        path = writer.close()
+        if path is not None:
+            outputs["company_overview"] = path
     else:
         logger.info("No company_overview data assembled.")
 
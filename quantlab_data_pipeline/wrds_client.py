@@ -4,6 +4,7 @@ import logging
 from datetime import date
 from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -42,35 +43,48 @@ def fetch_sp500_constituents(
             "Provide tickers_override or point to a membership table with permno,mbrstartdt,mbrenddt."
         )
 
-    # Fetch constituents and name history
-    cons_query = f"select permno, mbrstartdt, mbrenddt from {library}.{table}"
+    # Fetch constituents and name history. Only memberships that can overlap [start, end] are sent
+    # over the wire; the rest expand to zero days below. The names table stays whole: a permno whose
+    # name rows all fall outside the window must still drop out rather than take the fallback ticker.
+    cons_query = (
+        f"select permno, mbrstartdt, mbrenddt from {library}.{table}"
+        " where mbrstartdt <= %(end)s and (mbrenddt is null or mbrenddt >= %(start)s)"
+    )
     names_query = f"select permno, ticker, namedt, nameendt from {names_library}.{names_table}"
     logger.info("Querying WRDS for constituents: %s", cons_query)
-    const_raw = db.raw_sql(cons_query)
+    const_raw = db.raw_sql(cons_query, params={"start": start, "end": end})
     logger.info("Querying WRDS for permno->ticker mapping: %s", names_query)
     names_raw = db.raw_sql(names_query)
     db.close()
 
-    const_raw["mbrstartdt"] = pd.to_datetime(const_raw["mbrstartdt"]).dt.date
-    const_raw["mbrenddt"] = pd.to_datetime(const_raw["mbrenddt"]).dt.date
+    # Keep membership/name dates as datetime64 so every comparison below runs vectorized; the
+    # output date column stays datetime64 too.
+    const_raw["mbrstartdt"] = pd.to_datetime(const_raw["mbrstartdt"])
+    const_raw["mbrenddt"] = pd.to_datetime(const_raw["mbrenddt"])
     const_raw["permno"] = const_raw["permno"].astype(int)
 
-    names_raw["namedt"] = pd.to_datetime(names_raw["namedt"]).dt.date
-    names_raw["nameendt"] = pd.to_datetime(names_raw["nameendt"]).dt.date
+    names_raw["namedt"] = pd.to_datetime(names_raw["namedt"])
+    names_raw["nameendt"] = pd.to_datetime(names_raw["nameendt"])
     names_raw["permno"] = names_raw["permno"].astype(int)
     names_raw["ticker"] = names_raw["ticker"].astype(str).str.strip()
 
-    dates = pd.date_range(start=start, end=end, freq="D")
-    daily = []
-    for dt in dates:
-        mask = (const_raw["mbrstartdt"] <= dt.date()) & (
-            (const_raw["mbrenddt"].isna()) | (const_raw["mbrenddt"] >= dt.date())
-        )
-        active = const_raw.loc[mask, ["permno"]].copy()
-        active["date"] = dt.date()
-        daily.append(active)
+    # Expand each membership interval, clipped to [start, end], into one row per day: repeat the
+    # row once per covered day and add the day offset within its run. Open-ended memberships run
+    # to `end`; rows without a start date never match.
+    first = const_raw["mbrstartdt"].clip(lower=pd.Timestamp(start))
+    last = const_raw["mbrenddt"].fillna(pd.Timestamp(end)).clip(upper=pd.Timestamp(end))
+    n_days = ((last - first).dt.days + 1).fillna(0).clip(lower=0).astype(int).to_numpy()
+    rows = np.repeat(np.arange(len(const_raw)), n_days)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(n_days) - n_days, n_days)
+    expanded = pd.DataFrame(
+        {
+            "permno": const_raw["permno"].to_numpy()[rows],
+            "date": first.to_numpy()[rows] + offsets.astype("timedelta64[D]"),
+        }
+    )
+    # Day-major order, membership-table order within a day.
+    expanded = expanded.sort_values("date", kind="stable", ignore_index=True)
 
-    expanded = pd.concat(daily, ignore_index=True)
     # Map tickers by overlapping date ranges in names table
     merged = expanded.merge(names_raw, on="permno", how="left")
     merged = merged[
@@ -103,13 +117,13 @@ def fetch_ff_factors(
         raise ImportError("wrds package is required for WRDS access") from exc
 
     db = wrds.Connection(wrds_username=username, wrds_password=password)
-    ff_query = f"select * from {library}.{table}"
+    # Date range is applied server-side so only the requested days are transferred.
+    ff_query = f"select * from {library}.{table} where date between %(start)s and %(end)s"
     logger.info("Querying WRDS for FF factors: %s", ff_query)
-    ff = db.raw_sql(ff_query)
+    ff = db.raw_sql(ff_query, params={"start": start, "end": end})
 
     db.close()
     ff.columns = [c.lower() for c in ff.columns]
     if "date" in ff.columns:
-        ff["date"] = pd.to_datetime(ff["date"]).dt.date
-        ff = ff[(ff["date"] >= start) & (ff["date"] <= end)]
+        ff["date"] = pd.to_datetime(ff["date"])
     return ff
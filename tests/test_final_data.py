@@ -0,0 +1,41 @@
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from quantlab_data_pipeline import final_data
+
+
+@pytest.fixture
+def string_date_dataset(tmp_path, monkeypatch):
+    """A final dataset whose `date` column is stored as text, forcing the pandas date filter."""
+    table = pa.table(
+        {
+            "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+            "v": [1.0, 2.0, 3.0],
+        }
+    )
+    pq.write_table(table, tmp_path / "demo.parquet")
+    monkeypatch.setattr(final_data, "final_dataset_path", lambda name: tmp_path / f"{name}.parquet")
+    return "demo"
+
+
+def test_generator_columns_keep_requested_date(string_date_dataset):
+    df = final_data.get_final_data(
+        string_date_dataset,
+        start_date=date(2024, 1, 2),
+        columns=(c for c in ["date", "v"]),
+    )
+    assert list(df.columns) == ["date", "v"]
+    assert df["v"].tolist() == [2.0, 3.0]
+
+
+def test_date_filter_column_dropped_when_not_requested(string_date_dataset):
+    df = final_data.get_final_data(
+        string_date_dataset,
+        end_date=date(2024, 1, 2),
+        columns=(c for c in ["v"]),
+    )
+    assert list(df.columns) == ["v"]
+    assert df["v"].tolist() == [1.0, 2.0]